@@ -17,127 +17,13 @@ References:
 
 import argparse
 import math
+import re
+from functools import lru_cache
 import sys
 
-from bandpass_lib import (
-    calculate_bandpass_filter,
-    calculate_butterworth_g_values,
-    get_chebyshev_g_values,
-    calculate_resonator_components,
-    calculate_coupling_coefficients,
-    CHEBYSHEV_G_VALUES,
-    display_results,
-)
-
-
-BUTTERWORTH_BANDPASS_EXPLANATION = """
-Butterworth Bandpass Filter Explained
-=====================================
-
-A bandpass filter allows signals within a specific frequency range to pass through
-while blocking frequencies outside that range. This calculator designs "coupled
-resonator" filters - a series of LC tank circuits connected by coupling capacitors.
-
-The Butterworth response provides the flattest possible passband - signals within
-your frequency range pass through with minimal amplitude variation. The tradeoff
-is a gentler transition at the band edges compared to Chebyshev filters.
-
-Coupled resonator filters use LC "tanks" (parallel inductor-capacitor pairs) tuned
-to the center frequency. The coupling capacitors between tanks determine the
-bandwidth and shape of the response. More resonators give steeper skirts
-but require more components.
-
-Key parameters:
-  - Center frequency (f0): The middle of your passband
-  - Bandwidth (BW): The width of the passband (3dB points)
-  - Fractional BW: BW/f0 - keep below 40% for accurate results
-
-Component Q requirement: Inductors must have unloaded Q greater than (f0/BW)*2
-for acceptable insertion loss. Air-core inductors typically achieve Q of 100-300.
-
-Choose Butterworth when you need the smoothest passband response and can tolerate
-a gentler rolloff at the band edges.
-"""
-
-
-CHEBYSHEV_BANDPASS_EXPLANATION = """
-Chebyshev Bandpass Filter Explained
-===================================
-
-A bandpass filter allows signals within a specific frequency range to pass through
-while blocking frequencies outside that range. This calculator designs "coupled
-resonator" filters - a series of LC tank circuits connected by coupling capacitors.
-
-The Chebyshev response trades passband flatness for steeper rolloff at the band
-edges. Small "ripples" in the passband allow much sharper rejection of out-of-band
-signals compared to Butterworth filters of the same order.
-
-The "ripple" parameter controls this tradeoff:
-  - 0.1 dB: Nearly flat passband, moderate rolloff improvement
-  - 0.5 dB: Good balance of flatness and rolloff (recommended)
-  - 1.0 dB: Maximum rolloff steepness, noticeable passband variation
-
-Coupled resonator filters use LC "tanks" tuned to the center frequency. The
-coupling capacitors between tanks determine bandwidth and response shape. More
-resonators give steeper skirts but require more components and tighter tolerances.
-
-Key parameters:
-  - Center frequency (f0): The middle of your passband
-  - Bandwidth (BW): The width of the passband (3dB points)
-  - Fractional BW: BW/f0 - keep below 40% for accurate results
-
-Component Q requirement: Inductors must have unloaded Q greater than (f0/BW)*2
-for acceptable insertion loss. Chebyshev filters are more sensitive to component
-Q than Butterworth.
-
-Important: Chebyshev filters with equal source/load impedances require an ODD
-number of resonators (3, 5, 7, or 9). This is due to prototype g-value mathematics:
-even-order Chebyshev produces unequal termination impedances, requiring impedance
-transformers for matched 50-ohm systems. For even resonator counts, use Butterworth.
-
-Choose Chebyshev when you need sharp rejection of nearby interfering signals and
-can tolerate small passband ripple.
-"""
-
-
-BESSEL_BANDPASS_EXPLANATION = """
-Bessel (Thomson) Bandpass Filter Explained
-==========================================
-
-A bandpass filter allows signals within a specific frequency range to pass through
-while blocking frequencies outside that range. This calculator designs "coupled
-resonator" filters - a series of LC tank circuits connected by coupling capacitors.
-
-The Bessel filter (also called Thomson filter) is designed for maximally-flat
-group delay, which means all frequencies within the passband experience the same
-time delay. This results in linear phase response - the filter preserves the
-shape of signals passing through it.
-
-This makes Bessel bandpass filters ideal for:
-  - Pulse and transient applications where waveform shape matters
-  - Digital communications where timing relationships must be preserved
-  - SSB/CW reception where phase coherence affects audio quality
-  - Any application where overshoot and ringing are unacceptable
-
-The tradeoff is that Bessel filters have the gentlest rolloff of the three types.
-They don't attenuate unwanted frequencies as aggressively as Butterworth or
-Chebyshev filters. If sharp selectivity is your priority, choose one of those.
-
-Coupled resonator filters use LC "tanks" tuned to the center frequency. The
-coupling capacitors between tanks determine bandwidth and response shape. More
-resonators give steeper skirts but require more components.
-
-Key parameters:
-  - Center frequency (f0): The middle of your passband
-  - Bandwidth (BW): The width of the passband (3dB points)
-  - Fractional BW: BW/f0 - keep below 40% for accurate results
-
-Component Q requirement: Inductors must have unloaded Q greater than (f0/BW)*2
-for acceptable insertion loss.
-
-Choose Bessel when signal integrity and waveform preservation are more important
-than sharp frequency selectivity.
-"""
+# bandpass_lib is imported lazily inside verify_calculations() and main() so
+# that --help and argument errors exit without loading it; --explain only
+# reads the text files under bandpass_lib/explanations/
 
 
 # Physical limits for validation
@@ -145,6 +31,36 @@ MAX_FREQUENCY_HZ = 1e12  # 1 THz - physical upper limit
 MAX_IMPEDANCE_OHMS = 1e6  # 1 MOhm - practical upper limit
 SHUNT_C_FBW_LIMIT = 0.10  # Shunt-C topology bandwidth limit
 GENERAL_FBW_LIMIT = 0.40  # Narrowband approximation limit
+CHEBYSHEV_RIPPLES_DB = frozenset({0.1, 0.5, 1.0})  # Tabulated Chebyshev ripples
+
+# FBW limits as percentages, for the warning messages
+_SHUNT_PCT = SHUNT_C_FBW_LIMIT * 100
+_GEN_PCT = GENERAL_FBW_LIMIT * 100
+
+_TWO_PI = 2.0 * math.pi
+_INF = math.inf
+_RULE = '=' * 50
+
+# Accepted spellings for the filter type and coupling arguments, mapped to the
+# canonical name (identity entries included so lookups never need a fallback)
+FILTER_TYPE_ALIASES = {
+    'butterworth': 'butterworth', 'chebyshev': 'chebyshev', 'bessel': 'bessel',
+    'bw': 'butterworth', 'ch': 'chebyshev', 'bs': 'bessel',
+    'b': 'butterworth', 'c': 'chebyshev',
+}
+COUPLING_ALIASES = {'top': 'top', 'shunt': 'shunt', 't': 'top', 's': 'shunt'}
+FILTER_TYPE_CHOICES = tuple(FILTER_TYPE_ALIASES)
+COUPLING_CHOICES = tuple(COUPLING_ALIASES)
+
+
+# Number with optional unit suffix, matched in a single pass. Only the SI
+# prefix letter is captured and lowercased for the lookup; IGNORECASE also lets
+# [gmk] match non-ASCII case variants such as U+212A KELVIN SIGN, which lower()
+# folds to 'k' as the old whole-string lower() did
+_NUMBER_PATTERN = r'\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*'
+_FREQUENCY_RE = re.compile(_NUMBER_PATTERN + r'(?:([gmk]?)hz)?\s*', re.IGNORECASE)
+_IMPEDANCE_RE = re.compile(_NUMBER_PATTERN + r'(?:([mk]?)(?:ohm|ω))?\s*', re.IGNORECASE)
+_SI_PREFIXES = {'': 1, 'k': 1e3, 'm': 1e6, 'g': 1e9}
 
 
 def parse_frequency(freq_str: str) -> float:
@@ -165,22 +81,13 @@ def parse_frequency(freq_str: str) -> float:
     Raises:
         ValueError: If string cannot be parsed or is NaN/Infinity
     """
-    freq_str = freq_str.strip()
-    freq_str_lower = freq_str.lower()
-
-    suffixes = [('ghz', 1e9), ('mhz', 1e6), ('khz', 1e3), ('hz', 1)]
-
-    for suffix, mult in suffixes:
-        if freq_str_lower.endswith(suffix):
-            num_part = freq_str[:-len(suffix)].strip()
-            result = float(num_part) * mult
-            if not math.isfinite(result):
-                raise ValueError(f"Invalid frequency value: {freq_str}")
-            return result
-
-    result = float(freq_str)
-    if not math.isfinite(result):
-        raise ValueError(f"Invalid frequency value: {freq_str}")
+    match = _FREQUENCY_RE.fullmatch(freq_str)
+    if match is None:
+        raise ValueError(f"Invalid frequency value: {freq_str.strip()}")
+    number, prefix = match.groups()
+    result = float(number) * _SI_PREFIXES[(prefix or '').lower()]
+    if not -_INF < result < _INF:  # also rejects NaN
+        raise ValueError(f"Invalid frequency value: {freq_str.strip()}")
     return result
 
 
@@ -202,29 +109,79 @@ def parse_impedance(z_str: str) -> float:
     Raises:
         ValueError: If string cannot be parsed or is NaN/Infinity
     """
-    z_str = z_str.strip().lower()
-    for omega_char in ['ω', 'Ω']:
-        z_str = z_str.replace(omega_char, 'ohm')
-
-    multipliers = {'mohm': 1e6, 'kohm': 1e3, 'ohm': 1}
-
-    for suffix, mult in multipliers.items():
-        if z_str.endswith(suffix):
-            result = float(z_str[:-len(suffix)].strip()) * mult
-            if not math.isfinite(result):
-                raise ValueError(f"Invalid impedance value: {z_str}")
-            return result
-
-    result = float(z_str)
-    if not math.isfinite(result):
-        raise ValueError(f"Invalid impedance value: {z_str}")
+    match = _IMPEDANCE_RE.fullmatch(z_str)
+    if match is None:
+        raise ValueError(f"Invalid impedance value: {z_str.strip()}")
+    number, prefix = match.groups()
+    result = float(number) * _SI_PREFIXES[(prefix or '').lower()]
+    if not -_INF < result < _INF:  # also rejects NaN
+        raise ValueError(f"Invalid impedance value: {z_str.strip()}")
     return result
 
 
+def _frequency_arg(value: str) -> float:
+    """argparse type= adapter for parse_frequency."""
+    try:
+        return parse_frequency(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def _impedance_arg(value: str) -> float:
+    """argparse type= adapter for parse_impedance."""
+    try:
+        return parse_impedance(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def _from_center_bandwidth(f0: float, bw: float,
+                           f_low: float | None, f_high: float | None) -> tuple[float, float, float, float]:
+    """Handle -f + -b input: cutoffs are placed symmetrically around f0."""
+    return f0, bw, f0 - bw / 2, f0 + bw / 2
+
+
+def _from_cutoffs(f0: float | None, bw: float | None,
+                  f_low: float, f_high: float) -> tuple[float, float, float, float]:
+    """Handle --fl + --fh input: f0 is the geometric mean of the cutoffs."""
+    if f_low >= f_high:
+        raise ValueError("Lower frequency must be less than upper frequency")
+    return math.sqrt(f_low * f_high), f_high - f_low, f_low, f_high
+
+
+_ERR_BOTH_METHODS = "Specify either (-f + -b) OR (--fl + --fh), not both"
+_ERR_PARTIAL_CENTER = "Both -f and -b are required together"
+_ERR_PARTIAL_CUTOFF = "Both --fl and --fh are required together"
+_ERR_NO_FREQUENCY = "Specify frequency as (-f + -b) or (--fl + --fh)"
+
+# Handler (valid) or error message (invalid) for each frequency input
+# combination, indexed by the bit mask -f (bit 3), -b (bit 2), --fl (bit 1), --fh (bit 0)
+_FREQUENCY_INPUT_CASES = (
+    _ERR_NO_FREQUENCY,       # 0000
+    _ERR_PARTIAL_CUTOFF,     # 0001
+    _ERR_PARTIAL_CUTOFF,     # 0010
+    _from_cutoffs,           # 0011
+    _ERR_PARTIAL_CENTER,     # 0100
+    _ERR_PARTIAL_CENTER,     # 0101
+    _ERR_PARTIAL_CENTER,     # 0110
+    _from_cutoffs,           # 0111  (stray -b ignored)
+    _ERR_PARTIAL_CENTER,     # 1000
+    _ERR_PARTIAL_CENTER,     # 1001
+    _ERR_PARTIAL_CENTER,     # 1010
+    _from_cutoffs,           # 1011  (stray -f ignored)
+    _from_center_bandwidth,  # 1100
+    _from_center_bandwidth,  # 1101  (stray --fh ignored)
+    _from_center_bandwidth,  # 1110  (stray --fl ignored)
+    _ERR_BOTH_METHODS,       # 1111
+)
+
+
 def validate_and_compute_frequencies(args) -> tuple[float, float, float, float]:
     """
     Validate frequency inputs and compute center frequency + bandwidth.
 
+    Frequency arguments arrive already parsed to Hz by argparse (type=).
+
     Two valid input combinations:
     1. -f (center) + -b (bandwidth)
     2. --fl (low cutoff) + --fh (high cutoff)
@@ -242,39 +199,25 @@ def validate_and_compute_frequencies(args) -> tuple[float, float, float, float]:
     Raises:
         ValueError: If inputs invalid or incomplete
     """
-    has_center_bw = args.frequency is not None and args.bandwidth is not None
-    has_low_high = args.f_low is not None and args.f_high is not None
-    has_partial_center = (args.frequency is not None) != (args.bandwidth is not None)
-    has_partial_cutoff = (args.f_low is not None) != (args.f_high is not None)
-
-    # Check for valid combination
-    if has_center_bw and has_low_high:
-        raise ValueError("Specify either (-f + -b) OR (--fl + --fh), not both")
-
-    if not has_center_bw and not has_low_high:
-        if has_partial_center:
-            raise ValueError("Both -f and -b are required together")
-        if has_partial_cutoff:
-            raise ValueError("Both --fl and --fh are required together")
-        raise ValueError("Specify frequency as (-f + -b) or (--fl + --fh)")
-
-    if has_center_bw:
-        f0 = parse_frequency(args.frequency)
-        bw = parse_frequency(args.bandwidth)
-        f_low = f0 - bw / 2
-        f_high = f0 + bw / 2
-    else:
-        f_low = parse_frequency(args.f_low)
-        f_high = parse_frequency(args.f_high)
-
-        if f_low >= f_high:
-            raise ValueError("Lower frequency must be less than upper frequency")
-
-        # Geometric mean for center frequency
-        f0 = math.sqrt(f_low * f_high)
-        bw = f_high - f_low
-
-    return f0, bw, f_low, f_high
+    frequency, bandwidth, f_low, f_high = (
+        args.frequency, args.bandwidth, args.f_low, args.f_high)
+    mask = ((frequency is not None) << 3 | (bandwidth is not None) << 2
+            | (f_low is not None) << 1 | (f_high is not None))
+    case = _FREQUENCY_INPUT_CASES[mask]
+    if isinstance(case, str):
+        raise ValueError(case)
+    return case(frequency, bandwidth, f_low, f_high)
+
+
+def _first_invalid_quantity(f0: float, bw: float, z0: float) -> str:
+    """Return the error message for the first failed positivity/ordering check."""
+    if not f0 > 0:
+        return "Center frequency must be positive"
+    if not bw > 0:
+        return "Bandwidth must be positive"
+    if not bw < f0:
+        return "Bandwidth must be less than center frequency"
+    return "Impedance must be positive"
 
 
 def validate_inputs(f0: float, bw: float, z0: float, n_resonators: int,
@@ -286,8 +229,8 @@ def validate_inputs(f0: float, bw: float, z0: float, n_resonators: int,
         - Positive values for f0, bw, z0
         - Upper bounds for f0, z0
         - Pole count in allowed set
-        - Bandwidth constraints (warning only)
         - Ripple in allowed set for Chebyshev
+        - Bandwidth constraints (warning only)
 
     Args:
         f0: Center frequency in Hz
@@ -304,125 +247,165 @@ def validate_inputs(f0: float, bw: float, z0: float, n_resonators: int,
     Raises:
         ValueError: If any input is invalid
     """
-    warnings = []
-
-    if f0 <= 0:
-        raise ValueError("Center frequency must be positive")
+    # Positivity and ordering in one guard; the message is only built on failure
+    if not (f0 > 0 and bw > 0 and bw < f0 and z0 > 0):
+        raise ValueError(_first_invalid_quantity(f0, bw, z0))
     if f0 > MAX_FREQUENCY_HZ:
         raise ValueError(f"Center frequency exceeds {MAX_FREQUENCY_HZ/1e12:.0f} THz limit")
-    if bw <= 0:
-        raise ValueError("Bandwidth must be positive")
-    if bw >= f0:
-        raise ValueError("Bandwidth must be less than center frequency")
-    if z0 <= 0:
-        raise ValueError("Impedance must be positive")
     if z0 > MAX_IMPEDANCE_OHMS:
         raise ValueError(f"Impedance exceeds {MAX_IMPEDANCE_OHMS/1e6:.0f} MOhm limit")
     if not 2 <= n_resonators <= 9:
         raise ValueError("Resonators must be between 2 and 9")
 
-    # Chebyshev requires odd resonator count for equal terminations
-    if filter_type == 'chebyshev' and n_resonators % 2 == 0:
-        raise ValueError(
-            f"Chebyshev requires odd resonator count (3, 5, 7, 9) for equal terminations. "
-            f"Got {n_resonators}. Use Butterworth for even counts."
-        )
-
-    # Check fractional bandwidth
-    fbw = bw / f0
-    if fbw <= 0:
-        raise ValueError("Fractional bandwidth must be positive")
+    if filter_type == 'chebyshev':
+        # Chebyshev requires odd resonator count for equal terminations
+        if n_resonators % 2 == 0:
+            raise ValueError(
+                f"Chebyshev requires odd resonator count (3, 5, 7, 9) for equal terminations. "
+                f"Got {n_resonators}. Use Butterworth for even counts."
+            )
+        if ripple not in CHEBYSHEV_RIPPLES_DB:
+            raise ValueError("Ripple must be 0.1, 0.5, or 1.0 dB")
 
     # Bandwidth constraint warnings
+    warnings = []
+    fbw = bw / f0
     if coupling == 'shunt' and fbw > SHUNT_C_FBW_LIMIT:
-        warnings.append(f"FBW ({fbw*100:.1f}%) exceeds {SHUNT_C_FBW_LIMIT*100:.0f}% limit for Shunt-C topology")
-        warnings.append("Consider using Top-C (-c top) for wide bandwidth designs")
+        warnings += (f"FBW ({fbw*100:.1f}%) exceeds {_SHUNT_PCT:.0f}% limit for Shunt-C topology",
+                     "Consider using Top-C (-c top) for wide bandwidth designs")
     elif fbw > GENERAL_FBW_LIMIT:
-        warnings.append(f"FBW ({fbw*100:.1f}%) exceeds {GENERAL_FBW_LIMIT*100:.0f}% recommended limit")
-        warnings.append("Results may be inaccurate; consider transmission-line design")
-
-    if filter_type == 'chebyshev' and ripple not in [0.1, 0.5, 1.0]:
-        raise ValueError("Ripple must be 0.1, 0.5, or 1.0 dB")
+        warnings += (f"FBW ({fbw*100:.1f}%) exceeds {_GEN_PCT:.0f}% recommended limit",
+                     "Results may be inaccurate; consider transmission-line design")
 
     return warnings
 
 
+# Reference Butterworth g-values (Matthaei et al. tables) used by --verify
+_G_VALUE_TOLERANCE = 1e-4
+_EXPECTED_BUTTERWORTH = {
+    3: (1.00000, 2.00000, 1.00000),
+    5: (0.61803, 1.61803, 2.00000, 1.61803, 0.61803),
+    7: (0.44504, 1.24698, 1.80194, 2.00000, 1.80194, 1.24698, 0.44504),
+    9: (0.34730, 1.00000, 1.53209, 1.87939, 2.00000, 1.87939, 1.53209, 1.00000, 0.34730),
+}
+_CHEBYSHEV_VERIFY_ORDERS = (3, 5, 7, 9)
+
+
+def _chebyshev_reference_g_values(n: int, ripple_db: float) -> list[float]:
+    """
+    Closed-form Chebyshev lowpass prototype g-values (Matthaei et al. 4.05-2).
+
+    Independent of the tabulated CHEBYSHEV_G_VALUES, so --verify can catch a
+    missing or mistyped table entry.
+    """
+    beta = math.log(1 / math.tanh(ripple_db * math.log(10) / 40))
+    gamma = math.sinh(beta / (2 * n))
+    a = [math.sin((2 * k - 1) * math.pi / (2 * n)) for k in range(1, n + 1)]
+    b = [gamma * gamma + math.sin(k * math.pi / n) ** 2 for k in range(1, n)]
+    g = [2 * a[0] / gamma]
+    for k in range(1, n):
+        g.append(4 * a[k - 1] * a[k] / (b[k - 1] * g[-1]))
+    return g
+
+
 def verify_calculations() -> bool:
     """Verify core calculations against known values."""
-    print("Verifying Butterworth g-values...")
+    from bandpass_lib import (
+        calculate_butterworth_g_values,
+        get_chebyshev_g_values,
+        calculate_resonator_components,
+        calculate_coupling_coefficients,
+    )
 
-    expected = {
-        3: [1.00000, 2.00000, 1.00000],
-        5: [0.61803, 1.61803, 2.00000, 1.61803, 0.61803],
-        7: [0.44504, 1.24698, 1.80194, 2.00000, 1.80194, 1.24698, 0.44504],
-        9: [0.34730, 1.00000, 1.53209, 1.87939, 2.00000, 1.87939, 1.53209, 1.00000, 0.34730],
-    }
+    # Report lines are collected and written once at the end
+    lines = ["Verifying Butterworth g-values..."]
 
     all_pass = True
-    for n, exp_vals in expected.items():
+    for n, exp_vals in _EXPECTED_BUTTERWORTH.items():
         calc_vals = calculate_butterworth_g_values(n)
-        for i, (calc, exp) in enumerate(zip(calc_vals, exp_vals)):
-            if abs(calc - exp) > 0.0001:
-                print(f"  FAIL: n={n}, g{i+1}: calculated {calc:.5f}, expected {exp:.5f}")
-                all_pass = False
+        if len(calc_vals) != len(exp_vals):
+            lines.append(f"  FAIL: n={n}: got {len(calc_vals)} values, expected {len(exp_vals)}")
+            all_pass = False
+            continue
+        failing = [i for i, (calc, exp) in enumerate(zip(calc_vals, exp_vals))
+                   if not math.isclose(calc, exp, abs_tol=_G_VALUE_TOLERANCE)]
+        if failing:
+            all_pass = False
+            for i in failing:
+                lines.append(f"  FAIL: n={n}, g{i+1}: calculated {calc_vals[i]:.5f}, "
+                             f"expected {exp_vals[i]:.5f}")
 
     if all_pass:
-        print("  All Butterworth g-values verified within 0.0001")
-
-    print("\nVerifying Chebyshev g-value lookup...")
-    for ripple in [0.1, 0.5, 1.0]:
-        for n in [3, 5, 7, 9]:
-            g = get_chebyshev_g_values(n, ripple)
+        lines.append(f"  All Butterworth g-values verified within {_G_VALUE_TOLERANCE:g}")
+
+    lines.append("\nVerifying Chebyshev g-value lookup...")
+    for ripple in sorted(CHEBYSHEV_RIPPLES_DB):
+        for n in _CHEBYSHEV_VERIFY_ORDERS:
+            try:
+                g = get_chebyshev_g_values(n, ripple)
+            except ValueError as e:
+                lines.append(f"  FAIL: ripple={ripple}, n={n}: {e}")
+                all_pass = False
+                continue
             if len(g) != n:
-                print(f"  FAIL: ripple={ripple}, n={n}: got {len(g)} values")
+                lines.append(f"  FAIL: ripple={ripple}, n={n}: got {len(g)} values")
                 all_pass = False
+                continue
+            expected = _chebyshev_reference_g_values(n, ripple)
+            for i, (calc, exp) in enumerate(zip(g, expected)):
+                if not math.isclose(calc, exp, abs_tol=_G_VALUE_TOLERANCE):
+                    lines.append(f"  FAIL: ripple={ripple}, n={n}, g{i+1}: table {calc:.5f}, "
+                                 f"closed form {exp:.5f}")
+                    all_pass = False
     if all_pass:
-        print("  All Chebyshev lookups successful")
+        lines.append("  All Chebyshev lookups successful")
 
-    print("\nVerifying resonator calculation (resonance check)...")
+    lines.append("\nVerifying resonator calculation (resonance check)...")
     test_f0 = 7e6
     test_z0 = 50
+    omega0 = _TWO_PI * test_f0
     L, C = calculate_resonator_components(test_f0, test_z0)
-    calc_f0 = 1 / (2 * math.pi * math.sqrt(L * C))
-    error_ppm = abs(calc_f0 - test_f0) / test_f0 * 1e6
+    # Resonance at f0 means L*C == 1/omega0^2; compare without the sqrt round-trip.
+    # f0 goes as (L*C)^-1/2, so the relative f0 error is half the L*C error
+    error_ppm = 0.5 * abs(L * C * omega0 * omega0 - 1) * 1e6
     if error_ppm < 1:
-        print(f"  Resonance verified: error = {error_ppm:.3f} ppm")
+        lines.append(f"  Resonance verified: error = {error_ppm:.3f} ppm")
     else:
-        print(f"  FAIL: Resonance error = {error_ppm:.3f} ppm (should be < 1 ppm)")
+        lines.append(f"  FAIL: Resonance error = {error_ppm:.3f} ppm (should be < 1 ppm)")
         all_pass = False
 
-    print("\nVerifying coupling coefficients (k < 1 for valid designs)...")
+    lines.append("\nVerifying coupling coefficients (k < 1 for valid designs)...")
     g = calculate_butterworth_g_values(5)
     k = calculate_coupling_coefficients(g, 0.05)
-    if all(ki < 1 for ki in k):
-        print(f"  All coupling coefficients < 1: {[f'{ki:.4f}' for ki in k]}")
+    k_str = ', '.join(f'{ki:.4f}' for ki in k)
+    if max(k) < 1:
+        lines.append(f"  All coupling coefficients < 1: [{k_str}]")
     else:
-        print(f"  FAIL: Some k >= 1: {k}")
+        lines.append(f"  FAIL: Some k >= 1: [{k_str}]")
         all_pass = False
 
-    print("\n" + "=" * 50)
-    if all_pass:
-        print("ALL VERIFICATIONS PASSED")
-    else:
-        print("SOME VERIFICATIONS FAILED")
-    print("=" * 50)
+    verdict = "ALL VERIFICATIONS PASSED" if all_pass else "SOME VERIFICATIONS FAILED"
+    lines.append(f"\n{_RULE}\n{verdict}\n{_RULE}")
 
+    sys.stdout.write('\n'.join(lines) + '\n')
     return all_pass
 
 
-def resolve_filter_type(alias: str) -> str:
-    """Convert short aliases to full filter type names."""
-    return {'bw': 'butterworth', 'b': 'butterworth',
-            'ch': 'chebyshev', 'c': 'chebyshev',
-            'bs': 'bessel'}.get(alias, alias)
+def load_explanation(filter_type: str) -> str:
+    """Read the --explain text for a canonical filter type from package data."""
+    from importlib.resources import files
+    path = files('bandpass_lib') / 'explanations' / f'{filter_type}.txt'
+    return path.read_text(encoding='utf-8')
 
 
-def resolve_coupling(alias: str) -> str:
-    """Convert short aliases to full coupling type names."""
-    return {'t': 'top', 's': 'shunt'}.get(alias, alias)
-
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
 
-def main():
+    Cached: parse_args() only populates the returned namespace and leaves the
+    parser's actions untouched, so repeated main() calls can share one parser.
+    """
     parser = argparse.ArgumentParser(
         description='Coupled Resonator Bandpass Filter Calculator',
         epilog='''Examples:
@@ -436,36 +419,36 @@ def main():
 
     # Positional arguments (optional, fall back to flags)
     parser.add_argument('filter_type', nargs='?',
-                        choices=['butterworth', 'chebyshev', 'bessel', 'bw', 'ch', 'bs', 'b', 'c'],
+                        choices=FILTER_TYPE_CHOICES,
                         help='Filter type (butterworth/bw, chebyshev/ch, or bessel/bs)')
     parser.add_argument('coupling_pos', nargs='?',
-                        choices=['top', 'shunt', 't', 's'],
+                        choices=COUPLING_CHOICES,
                         help='Coupling topology (top/t or shunt/s)')
 
     # Filter type flag (alternative to positional)
     parser.add_argument('-t', '--type', dest='type_flag',
-                        choices=['butterworth', 'chebyshev', 'bessel', 'bw', 'ch', 'bs', 'b', 'c'],
+                        choices=FILTER_TYPE_CHOICES,
                         help='Filter type (alternative to positional)')
 
     # Frequency input method 1: center + bandwidth
-    parser.add_argument('-f', '--frequency',
+    parser.add_argument('-f', '--frequency', type=_frequency_arg,
                         help='Center frequency (e.g., 14.2MHz, 7.1MHz)')
-    parser.add_argument('-b', '--bandwidth',
+    parser.add_argument('-b', '--bandwidth', type=_frequency_arg,
                         help='3dB bandwidth (e.g., 500kHz, 1MHz)')
 
     # Frequency input method 2: lower/upper cutoff
-    parser.add_argument('--fl', '--f-low', dest='f_low',
+    parser.add_argument('--fl', '--f-low', dest='f_low', type=_frequency_arg,
                         help='Lower cutoff frequency (e.g., 14MHz)')
-    parser.add_argument('--fh', '--f-high', dest='f_high',
+    parser.add_argument('--fh', '--f-high', dest='f_high', type=_frequency_arg,
                         help='Upper cutoff frequency (e.g., 14.35MHz)')
 
     # Coupling topology flag (alternative to positional)
     parser.add_argument('-c', '--coupling', dest='coupling_flag',
-                        choices=['top', 'shunt', 't', 's'],
+                        choices=COUPLING_CHOICES,
                         help='Coupling topology (alternative to positional)')
 
     # Other parameters
-    parser.add_argument('-z', '--impedance', default='50',
+    parser.add_argument('-z', '--impedance', default='50', type=_impedance_arg,
                         help='System impedance (default: 50 ohms)')
     parser.add_argument('-n', '--resonators', type=int, default=2,
                         choices=range(2, 10),
@@ -503,6 +486,11 @@ def main():
     plot_group.add_argument('--plot-data', choices=['json', 'csv'],
                             help='Export frequency response data')
 
+    return parser
+
+
+def main():
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Handle --verify
@@ -518,13 +506,7 @@ def main():
     if args.explain:
         if filter_type is None:
             parser.error('--explain requires filter type')
-        resolved_type = resolve_filter_type(filter_type)
-        if resolved_type == 'butterworth':
-            print(BUTTERWORTH_BANDPASS_EXPLANATION)
-        elif resolved_type == 'chebyshev':
-            print(CHEBYSHEV_BANDPASS_EXPLANATION)
-        else:
-            print(BESSEL_BANDPASS_EXPLANATION)
+        print('\n' + load_explanation(FILTER_TYPE_ALIASES[filter_type]))
         sys.exit(0)
 
     # Validate required arguments for calculation
@@ -533,16 +515,19 @@ def main():
     if coupling is None:
         parser.error('Coupling topology required (positional or -c/--coupling)')
 
-    filter_type = resolve_filter_type(filter_type)
-    coupling = resolve_coupling(coupling)
+    # Canonical names are module literals, so later compares hit identity
+    filter_type = FILTER_TYPE_ALIASES[filter_type]
+    coupling = COUPLING_ALIASES[coupling]
+
+    n_resonators, ripple, q_safety = args.resonators, args.ripple, args.q_safety
 
     # Parse and validate
     try:
         f0, bw, f_low, f_high = validate_and_compute_frequencies(args)
-        z0 = parse_impedance(args.impedance)
-        if args.q_safety <= 0:
+        z0 = args.impedance
+        if q_safety <= 0:
             raise ValueError("Q safety factor must be positive")
-        warnings = validate_inputs(f0, bw, z0, args.resonators, filter_type, args.ripple, coupling)
+        warnings = validate_inputs(f0, bw, z0, n_resonators, filter_type, ripple, coupling)
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -551,25 +536,28 @@ def main():
     for w in warnings:
         print(f"Warning: {w}", file=sys.stderr)
 
+    from dataclasses import replace
+
+    from bandpass_lib import calculate_bandpass_filter, display_results
+
     # Calculate filter
     try:
         result = calculate_bandpass_filter(
             f0=f0,
             bw=bw,
             z0=z0,
-            n_resonators=args.resonators,
+            n_resonators=n_resonators,
             filter_type=filter_type,
             coupling=coupling,
-            ripple_db=args.ripple if filter_type == 'chebyshev' else 0.5,
-            q_safety=args.q_safety
+            ripple_db=ripple if filter_type == 'chebyshev' else 0.5,
+            q_safety=q_safety
         )
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
     # Override f_low/f_high with user-computed values (geometric mean vs arithmetic)
-    result['f_low'] = f_low
-    result['f_high'] = f_high
+    result = replace(result, f_low=f_low, f_high=f_high)
 
     # Display results
     display_results(
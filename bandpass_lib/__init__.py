@@ -4,95 +4,81 @@ Coupled Resonator Bandpass Filter Library
 Components:
 - calculations: Core filter math functions (g-values, coupling, components)
 - formatting: Output display and unit formatting
-"""
-
-from .calculations import (
-    CHEBYSHEV_G_VALUES,
-    BESSEL_G_VALUES,
-    calculate_butterworth_g_values,
-    get_chebyshev_g_values,
-    get_bessel_g_values,
-    calculate_coupling_coefficients,
-    calculate_external_q,
-    calculate_resonator_components,
-    calculate_coupling_capacitors_top_c,
-    calculate_coupling_capacitors_shunt_c,
-    calculate_tank_capacitors,
-    calculate_min_q,
-    calculate_bandpass_filter,
-)
-
-from .formatting import (
-    format_frequency,
-    format_capacitance,
-    format_inductance,
-    format_json,
-    format_csv,
-    format_quiet,
-    display_results,
-)
+- eseries: Standard E-series component matching
+- transfer: Transfer function magnitude and frequency sweeps
+- plotting: ASCII frequency response plots and data export
 
-from .eseries import (
-    E_SERIES,
-    ESeriesMatch,
-    find_closest_single,
-    find_parallel_combo,
-    match_component,
-)
+Submodules are imported on first attribute access (PEP 562), so importing
+the package itself is cheap.
+"""
 
-from .transfer import (
-    chebyshev_polynomial,
-    magnitude_butterworth,
-    magnitude_chebyshev,
-    magnitude_bessel,
-    magnitude_db,
-    frequency_sweep,
-)
+import importlib
 
-from .plotting import (
-    render_ascii_plot,
-    export_json,
-    export_csv,
-)
 
-__all__ = [
+# Public name -> defining submodule, grouped in the order of __all__
+_EXPORTS = {
     # Calculations
-    'CHEBYSHEV_G_VALUES',
-    'BESSEL_G_VALUES',
-    'calculate_butterworth_g_values',
-    'get_chebyshev_g_values',
-    'get_bessel_g_values',
-    'calculate_coupling_coefficients',
-    'calculate_external_q',
-    'calculate_resonator_components',
-    'calculate_coupling_capacitors_top_c',
-    'calculate_coupling_capacitors_shunt_c',
-    'calculate_tank_capacitors',
-    'calculate_min_q',
-    'calculate_bandpass_filter',
+    'CHEBYSHEV_G_VALUES': 'calculations',
+    'BESSEL_G_VALUES': 'calculations',
+    'calculate_butterworth_g_values': 'calculations',
+    'get_chebyshev_g_values': 'calculations',
+    'get_bessel_g_values': 'calculations',
+    'calculate_coupling_coefficients': 'calculations',
+    'calculate_external_q': 'calculations',
+    'calculate_resonator_components': 'calculations',
+    'calculate_coupling_capacitors_top_c': 'calculations',
+    'calculate_coupling_capacitors_shunt_c': 'calculations',
+    'calculate_tank_capacitors': 'calculations',
+    'calculate_min_q': 'calculations',
+    'calculate_bandpass_filter': 'calculations',
+    'BandpassDesign': 'calculations',
     # Formatting
-    'format_frequency',
-    'format_capacitance',
-    'format_inductance',
-    'format_json',
-    'format_csv',
-    'format_quiet',
-    'display_results',
+    'format_frequency': 'formatting',
+    'format_capacitance': 'formatting',
+    'format_inductance': 'formatting',
+    'format_json': 'formatting',
+    'format_csv': 'formatting',
+    'format_quiet': 'formatting',
+    'display_results': 'formatting',
     # E-series matching
-    'E_SERIES',
-    'ESeriesMatch',
-    'find_closest_single',
-    'find_parallel_combo',
-    'match_component',
+    'E_SERIES': 'eseries',
+    'PARALLEL_SEARCH_THRESHOLD_PCT': 'eseries',
+    'ESeriesMatch': 'eseries',
+    'find_closest_single': 'eseries',
+    'find_parallel_combo': 'eseries',
+    'match_component': 'eseries',
+    'match_components': 'eseries',
     # Transfer functions
-    'chebyshev_polynomial',
-    'magnitude_butterworth',
-    'magnitude_chebyshev',
-    'magnitude_bessel',
-    'magnitude_db',
-    'frequency_sweep',
+    'chebyshev_polynomial': 'transfer',
+    'magnitude_butterworth': 'transfer',
+    'magnitude_chebyshev': 'transfer',
+    'magnitude_bessel': 'transfer',
+    'magnitude_db': 'transfer',
+    'frequency_sweep': 'transfer',
     # Plotting
-    'render_ascii_plot',
-    'export_json',
-    'export_csv',
-]
+    'render_ascii_plot': 'plotting',
+    'export_json': 'plotting',
+    'export_csv': 'plotting',
+}
+
+__all__ = list(_EXPORTS)
+
+# Submodules reachable as package attributes, as with eager imports
+_SUBMODULES = frozenset(_EXPORTS.values())
+
+
+def __getattr__(name: str):
+    """Import the defining submodule on first access and cache the attribute."""
+    if name in _SUBMODULES:
+        # import_module also binds the submodule as a package attribute
+        return importlib.import_module(f'.{name}', __name__)
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
@@ -2,17 +2,20 @@
 E-series component matching for standard resistor/capacitor values.
 Reference: IEC 60063 (Preferred number series for resistors and capacitors)
 """
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 import math
 
 # E-series normalized values (1.0-10.0 range), geometric progression
-E_SERIES: dict[str, list[float]] = {
-    'E12': [1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2],
-    'E24': [
+E_SERIES: dict[str, tuple[float, ...]] = {
+    'E12': (1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2),
+    'E24': (
         1.0, 1.1, 1.2, 1.3, 1.5, 1.6, 1.8, 2.0, 2.2, 2.4, 2.7, 3.0,
         3.3, 3.6, 3.9, 4.3, 4.7, 5.1, 5.6, 6.2, 6.8, 7.5, 8.2, 9.1
-    ],
-    'E96': [
+    ),
+    'E96': (
         1.00, 1.02, 1.05, 1.07, 1.10, 1.13, 1.15, 1.18, 1.21, 1.24,
         1.27, 1.30, 1.33, 1.37, 1.40, 1.43, 1.47, 1.50, 1.54, 1.58,
         1.62, 1.65, 1.69, 1.74, 1.78, 1.82, 1.87, 1.91, 1.96, 2.00,
@@ -23,13 +26,31 @@ E_SERIES: dict[str, list[float]] = {
         5.36, 5.49, 5.62, 5.76, 5.90, 6.04, 6.19, 6.34, 6.49, 6.65,
         6.81, 6.98, 7.15, 7.32, 7.50, 7.68, 7.87, 8.06, 8.25, 8.45,
         8.66, 8.87, 9.09, 9.31, 9.53, 9.76
-    ],
+    ),
 }
 
+# Single-match error (%) at or below which match_component() skips the
+# parallel search: roughly a quarter of each series' step between values
+PARALLEL_SEARCH_THRESHOLD_PCT: dict[str, float] = {'E12': 5.0, 'E24': 2.5, 'E96': 0.5}
 
-@dataclass
+# Per-series search ladder: normalized values bracketed by the neighbouring
+# decades' boundary values as sentinels, plus the matching (value, decade
+# offset) steps used to denormalize a ladder entry exactly
+_LADDERS: dict[str, tuple[tuple[float, ...], tuple[tuple[float, int], ...]]] = {
+    name: ((values[-1] / 10, *values, 10.0),
+           ((values[-1], -1), *((v, 0) for v in values), (values[0], 1)))
+    for name, values in E_SERIES.items()
+}
+
+# Powers of ten 1e-18..1e18 for normalizing without log10/pow
+_POW10_OFFSET = 18
+_POW10 = tuple(10.0 ** k for k in range(-_POW10_OFFSET, _POW10_OFFSET + 1))
+_LOG10_2 = math.log10(2)
+
+
+@dataclass(frozen=True)
 class ESeriesMatch:
-    """Result of E-series component matching."""
+    """Result of E-series component matching (immutable; may be shared)."""
     target: float                           # Original target value
     single_value: float                     # Closest single E-series value
     single_error_pct: float                 # Error percentage for single
@@ -42,11 +63,21 @@ def _normalize(value: float) -> tuple[float, int]:
     """Extract mantissa (1.0-10.0) and decade exponent. E.g. 4700 -> (4.7, 3)"""
     if value <= 0:
         raise ValueError("Value must be positive")
+    # The binary exponent from frexp puts floor(log10(value)) at the estimate
+    # or one above it; one comparison against the power table settles it
+    decade = math.floor((math.frexp(value)[1] - 1) * _LOG10_2)
+    i = decade + _POW10_OFFSET
+    if 0 <= i < len(_POW10) - 1:
+        if value >= _POW10[i + 1]:
+            decade, i = decade + 1, i + 1
+        return value / _POW10[i], decade
     decade = math.floor(math.log10(value))
     return value / (10 ** decade), decade
 
 def _denormalize(mantissa: float, decade: int) -> float:
     """Reconstruct value from mantissa and decade."""
+    if -_POW10_OFFSET <= decade <= _POW10_OFFSET:
+        return mantissa * _POW10[decade + _POW10_OFFSET]
     return mantissa * (10 ** decade)
 
 def _error_pct(actual: float, target: float) -> float:
@@ -58,24 +89,28 @@ def find_closest_single(target: float, series: str = 'E24') -> tuple[float, floa
     """Find closest single E-series value. Returns (matched_value, error_pct)."""
     if series not in E_SERIES:
         raise ValueError(f"Unknown series '{series}'. Use E12, E24, or E96.")
-    _, decade = _normalize(target)
-    series_values = E_SERIES[series]
+    mantissa, decade = _normalize(target)
+    ladder, steps = _LADDERS[series]
+    # The sentinels guarantee a neighbour on each side of the mantissa, so
+    # exactly two candidates are scored with no edge-case branches
+    i = bisect_left(ladder, mantissa, 1, len(ladder) - 1)
+    scale = 100.0 / target  # _error_pct() with the division hoisted
     best_value, best_error = None, float('inf')
-    # Check all values in current decade
-    for sv in series_values:
-        candidate = _denormalize(sv, decade)
-        err = _error_pct(candidate, target)
-        if err < best_error:
-            best_error, best_value = err, candidate
-    # Check boundary values in adjacent decades
-    for candidate in [_denormalize(series_values[0], decade + 1),
-                      _denormalize(series_values[-1], decade - 1)]:
-        err = _error_pct(candidate, target)
+    for sv, offset in steps[i - 1:i + 1]:
+        candidate = _denormalize(sv, decade + offset)
+        err = abs(candidate - target) * scale
         if err < best_error:
             best_error, best_value = err, candidate
     return best_value, best_error
 
 
+@lru_cache(maxsize=64)
+def _parallel_candidates(series: str, decade: int) -> tuple[float, ...]:
+    """Series values spanning decade-1..decade+2, ascending; cached per (series, decade)."""
+    return tuple([_denormalize(sv, d) for d in range(decade - 1, decade + 3)
+                  for sv in E_SERIES[series]])
+
+
 def find_parallel_combo(
     target: float, series: str = 'E24', ratio_limit: float = 10.0
 ) -> tuple[tuple[float, float], float, float] | None:
@@ -86,13 +121,11 @@ def find_parallel_combo(
     if series not in E_SERIES:
         raise ValueError(f"Unknown series '{series}'. Use E12, E24, or E96.")
     _, decade = _normalize(target)
-    # Build candidate values spanning relevant decades
-    candidates = [_denormalize(sv, d) for d in range(decade - 1, decade + 3)
-                  for sv in E_SERIES[series]]
+    candidates = _parallel_candidates(series, decade)
+    scale = 100.0 / target  # _error_pct() with the division hoisted
     best_combo, best_value, best_error = None, None, float('inf')
-    for v1 in candidates:
-        if v1 <= target:
-            continue  # V1 must be > target for parallel to work
+    # V1 must be > target for parallel to work; skip the rest by bisection
+    for v1 in candidates[bisect_right(candidates, target):]:
         # Calculate V2 needed: V2 = V1*target/(V1-target)
         v2_needed = v1 * target / (v1 - target)
         if v2_needed <= 0:
@@ -102,19 +135,51 @@ def find_parallel_combo(
         if max(v1, v2) / min(v1, v2) > ratio_limit:
             continue
         parallel_val = (v1 * v2) / (v1 + v2)
-        err = _error_pct(parallel_val, target)
+        err = abs(parallel_val - target) * scale
         if err < best_error:
             best_error, best_value, best_combo = err, parallel_val, (v1, v2)
     return (best_combo, best_value, best_error) if best_combo else None
 
 
 def match_component(
-    target: float, series: str = 'E24', ratio_limit: float = 10.0
+    target: float, series: str = 'E24', ratio_limit: float = 10.0,
+    parallel_threshold_pct: float | None = None
 ) -> ESeriesMatch:
-    """Find best E-series match. Returns both single and parallel options."""
+    """
+    Find best E-series match. Returns both single and parallel options.
+    The parallel search is skipped when the single value is already within
+    parallel_threshold_pct (default: PARALLEL_SEARCH_THRESHOLD_PCT[series]);
+    pass 0 to always search.
+    """
     single_val, single_err = find_closest_single(target, series)
+    if parallel_threshold_pct is None:
+        parallel_threshold_pct = PARALLEL_SEARCH_THRESHOLD_PCT[series]
+    if single_err < parallel_threshold_pct:
+        return ESeriesMatch(target, single_val, single_err, None, None, None)
     parallel_result = find_parallel_combo(target, series, ratio_limit)
     if parallel_result:
         combo, par_val, par_err = parallel_result
         return ESeriesMatch(target, single_val, single_err, combo, par_val, par_err)
     return ESeriesMatch(target, single_val, single_err, None, None, None)
+
+
+def match_components(
+    targets: Iterable[float], series: str = 'E24', ratio_limit: float = 10.0,
+    parallel_threshold_pct: float | None = None
+) -> list[ESeriesMatch]:
+    """
+    Match several component values at once. Returns one ESeriesMatch per
+    target, in order. Repeated values (e.g. the mirrored tank capacitors of
+    a symmetric design) are matched once and share the result object.
+    """
+    if series not in E_SERIES:
+        raise ValueError(f"Unknown series '{series}'. Use E12, E24, or E96.")
+    matches: dict[float, ESeriesMatch] = {}
+    results = []
+    for target in targets:
+        match = matches.get(target)
+        if match is None:
+            match = matches[target] = match_component(target, series, ratio_limit,
+                                                      parallel_threshold_pct)
+        results.append(match)
+    return results
@@ -4,124 +4,198 @@ Output formatting for coupled resonator bandpass filters.
 Contains unit formatters and display functions for filter results.
 """
 
-import csv
 import io
-import json
+from functools import lru_cache, wraps
 
-from .eseries import match_component
+from .calculations import BandpassDesign
+from .eseries import ESeriesMatch, match_components
 from .transfer import frequency_sweep
-from .plotting import render_ascii_plot, export_json as plot_export_json, export_csv as plot_export_csv
+from .plotting import (render_ascii_plot, export_json as plot_export_json,
+                       export_csv as plot_export_csv)
 
 # Default number of points for frequency sweep plots
 PLOT_POINTS = 61
 
+# (threshold, suffix) unit tables, largest first
+_FREQ_UNITS = ((1e9, 'GHz'), (1e6, 'MHz'), (1e3, 'kHz'), (1, 'Hz'))
+_CAP_UNITS = ((1e-3, 'mF'), (1e-6, 'µF'), (1e-9, 'nF'), (1e-12, 'pF'))
+_IND_UNITS = ((1, 'H'), (1e-3, 'mH'), (1e-6, 'µH'), (1e-9, 'nH'))
+
+# Fixed rules and box borders for the results table
+_RULE = "=" * 50
+_ESERIES_RULE = "─" * 45
+_BOX_TOP = f"┌{'─' * 24}┬{'─' * 24}┐"
+_BOX_HEADER = f"│{'Tank Capacitors':^24}│{'Inductors':^24}│"
+_BOX_MID = f"├{'─' * 24}┼{'─' * 24}┤"
+_BOX_BOT = f"└{'─' * 24}┴{'─' * 24}┘"
+_CC_TOP = f"┌{'─' * 24}┐"
+_CC_HEADER = f"│{'Coupling Capacitors':^24}│"
+_CC_MID = f"├{'─' * 24}┤"
+_CC_BOT = f"└{'─' * 24}┘"
+
+
+def _memoize_formatter(func):
+    """
+    lru_cache a one-argument formatter, bypassing the cache for zero.
 
-def _format_with_units(value: float, units: list[tuple[float, str]], precision: str = ".4g") -> str:
-    """Generic formatter for values with unit suffixes."""
+    0.0 and -0.0 are the same cache key but format differently
+    ('-0.00 pF'), so zeros are always formatted fresh.
+    """
+    cached = lru_cache(maxsize=1024)(func)
+
+    @wraps(func)
+    def wrapper(value: float):
+        return cached(value) if value else func(value)
+    return wrapper
+
+
+def _format_parts(value: float, units: tuple[tuple[float, str], ...],
+                  precision: str = ".4g") -> tuple[str, str]:
+    """Scale value to the first fitting unit. Returns (number, suffix)."""
+    magnitude = abs(value)
     for threshold, suffix in units:
-        if abs(value) >= threshold:
-            return f"{value/threshold:{precision}} {suffix}"
+        if magnitude >= threshold:
+            return f"{value/threshold:{precision}}", suffix
     # Use last unit if value is smaller than all thresholds
-    _, suffix = units[-1]
-    return f"{value/units[-1][0]:{precision}} {suffix}"
+    threshold, suffix = units[-1]
+    return f"{value/threshold:{precision}}", suffix
 
 
+def _format_with_units(value: float, units: tuple[tuple[float, str], ...], precision: str = ".4g") -> str:
+    """Generic formatter for values with unit suffixes."""
+    number, suffix = _format_parts(value, units, precision)
+    return f"{number} {suffix}"
+
+
+@_memoize_formatter
 def format_frequency(freq_hz: float) -> str:
     """Format frequency with appropriate unit (GHz, MHz, kHz, Hz)."""
-    return _format_with_units(freq_hz, [
-        (1e9, 'GHz'), (1e6, 'MHz'), (1e3, 'kHz'), (1, 'Hz')
-    ])
+    return _format_with_units(freq_hz, _FREQ_UNITS)
+
+
+@_memoize_formatter
+def _format_capacitance_parts(value_farads: float) -> tuple[str, str]:
+    """Capacitance as (number, unit), e.g. ('4.70', 'nF')."""
+    return _format_parts(value_farads, _CAP_UNITS, ".2f")
+
 
+@_memoize_formatter
+def _format_inductance_parts(value_henries: float) -> tuple[str, str]:
+    """Inductance as (number, unit), e.g. ('1.20', 'µH')."""
+    return _format_parts(value_henries, _IND_UNITS, ".2f")
 
+
+@_memoize_formatter
 def format_capacitance(value_farads: float) -> str:
     """Format capacitance with appropriate unit (mF, µF, nF, pF)."""
-    return _format_with_units(value_farads, [
-        (1e-3, 'mF'), (1e-6, 'µF'), (1e-9, 'nF'), (1e-12, 'pF')
-    ], ".2f")
+    number, unit = _format_capacitance_parts(value_farads)
+    return f"{number} {unit}"
 
 
+@_memoize_formatter
 def format_inductance(value_henries: float) -> str:
     """Format inductance with appropriate unit (H, mH, µH, nH)."""
-    return _format_with_units(value_henries, [
-        (1, 'H'), (1e-3, 'mH'), (1e-6, 'µH'), (1e-9, 'nH')
-    ], ".2f")
+    number, unit = _format_inductance_parts(value_henries)
+    return f"{number} {unit}"
 
 
-def format_json(result: dict) -> str:
+def format_json(result: BandpassDesign) -> str:
     """Format results as JSON."""
     output = {
-        'filter_type': result['filter_type'],
-        'coupling': result['coupling'],
-        'center_frequency_hz': result['f0'],
-        'bandwidth_hz': result['bw'],
-        'f_low_hz': result['f_low'],
-        'f_high_hz': result['f_high'],
-        'fractional_bw': result['fbw'],
-        'impedance_ohms': result['z0'],
-        'n_resonators': result['n_resonators'],
-        'q_min': result['q_min'],
+        'filter_type': result.filter_type,
+        'coupling': result.coupling,
+        'center_frequency_hz': result.f0,
+        'bandwidth_hz': result.bw,
+        'f_low_hz': result.f_low,
+        'f_high_hz': result.f_high,
+        'fractional_bw': result.fbw,
+        'impedance_ohms': result.z0,
+        'n_resonators': result.n_resonators,
+        'q_min': result.q_min,
         'components': {
             'tank_capacitors': [{'name': f'Cp{i+1}', 'value_farads': v}
-                               for i, v in enumerate(result['c_tank'])],
-            'inductors': [{'name': f'L{i+1}', 'value_henries': result['L_resonant']}
-                         for i in range(result['n_resonators'])],
+                               for i, v in enumerate(result.c_tank)],
+            'inductors': [{'name': f'L{i+1}', 'value_henries': result.L_resonant}
+                         for i in range(result.n_resonators)],
             'coupling_capacitors': [{'name': f'Cs{i+1}{i+2}', 'value_farads': v}
-                                   for i, v in enumerate(result['c_coupling'])]
+                                   for i, v in enumerate(result.c_coupling)]
         },
         'external_q': {
-            'input': result['qe_in'],
-            'output': result['qe_out']
+            'input': result.qe_in,
+            'output': result.qe_out
         }
     }
-    if result.get('ripple_db') is not None:
-        output['ripple_db'] = result['ripple_db']
+    if result.ripple_db is not None:
+        output['ripple_db'] = result.ripple_db
+    import json  # deferred: only JSON output needs it
     return json.dumps(output, indent=2)
 
 
-def format_csv(result: dict) -> str:
+def format_csv(result: BandpassDesign) -> str:
     """Format results as CSV."""
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(['Component', 'Value', 'Unit'])
-    for i, v in enumerate(result['c_tank']):
-        formatted = format_capacitance(v)
-        val, unit = formatted.rsplit(' ', 1)
-        writer.writerow([f'Cp{i+1}', val, unit])
-    for i in range(result['n_resonators']):
-        formatted = format_inductance(result['L_resonant'])
-        val, unit = formatted.rsplit(' ', 1)
-        writer.writerow([f'L{i+1}', val, unit])
-    for i, v in enumerate(result['c_coupling']):
-        formatted = format_capacitance(v)
-        val, unit = formatted.rsplit(' ', 1)
-        writer.writerow([f'Cs{i+1}{i+2}', val, unit])
-    return output.getvalue()
-
-
-def format_quiet(result: dict, raw: bool = False) -> str:
+    # Fixed schema: names, numbers and unit suffixes never need quoting, so
+    # rows are written directly (csv.writer's default \r\n terminator kept)
+    out = io.StringIO()
+    write = out.write
+    write("Component,Value,Unit\r\n")
+    for i, v in enumerate(result.c_tank):
+        value, unit = _format_capacitance_parts(v)
+        write(f"Cp{i+1},{value},{unit}\r\n")
+    value, unit = _format_inductance_parts(result.L_resonant)
+    for i in range(result.n_resonators):
+        write(f"L{i+1},{value},{unit}\r\n")
+    for i, v in enumerate(result.c_coupling):
+        value, unit = _format_capacitance_parts(v)
+        write(f"Cs{i+1}{i+2},{value},{unit}\r\n")
+    return out.getvalue()
+
+
+def format_quiet(result: BandpassDesign, raw: bool = False) -> str:
     """Format results as minimal text (values only)."""
-    lines = []
-    for i, v in enumerate(result['c_tank']):
+    out = io.StringIO()
+    write = out.write
+    for i, v in enumerate(result.c_tank):
         if raw:
-            lines.append(f"Cp{i+1}: {v:.6e} F")
+            write(f"Cp{i+1}: {v:.6e} F\n")
         else:
-            lines.append(f"Cp{i+1}: {format_capacitance(v)}")
-    for i in range(result['n_resonators']):
+            write(f"Cp{i+1}: {format_capacitance(v)}\n")
+    for i in range(result.n_resonators):
         if raw:
-            lines.append(f"L{i+1}: {result['L_resonant']:.6e} H")
+            write(f"L{i+1}: {result.L_resonant:.6e} H\n")
         else:
-            lines.append(f"L{i+1}: {format_inductance(result['L_resonant'])}")
-    for i, v in enumerate(result['c_coupling']):
+            write(f"L{i+1}: {format_inductance(result.L_resonant)}\n")
+    for i, v in enumerate(result.c_coupling):
         if raw:
-            lines.append(f"Cs{i+1}{i+2}: {v:.6e} F")
+            write(f"Cs{i+1}{i+2}: {v:.6e} F\n")
         else:
-            lines.append(f"Cs{i+1}{i+2}: {format_capacitance(v)}")
-    return '\n'.join(lines)
+            write(f"Cs{i+1}{i+2}: {format_capacitance(v)}\n")
+    return out.getvalue()[:-1]  # no trailing newline
+
 
+def _overlay(chars: list[str], start: int, text: str) -> None:
+    """Write text into chars at start via one slice assignment, clipped to the line."""
+    lo, hi = max(start, 0), min(start + len(text), len(chars))
+    if lo < hi:
+        chars[lo:hi] = text[lo - start:hi - start]
 
-def _print_top_c_diagram(n: int) -> None:
+
+def _uniform_row(elem: str, first: int, pitch: int, n: int, line_len: int) -> str:
+    """
+    Build a row with the same element centered at n evenly spaced positions.
+
+    Closed-form equivalent of overlaying elem at first + i*pitch; relies on
+    the element fitting between positions and inside the line, as the
+    diagram layouts guarantee.
+    """
+    gap = ' ' * (pitch - len(elem))
+    return (' ' * (first - len(elem) // 2) + elem
+            + (gap + elem) * (n - 1)).ljust(line_len)
+
+
+@lru_cache(maxsize=32)
+def _top_c_diagram(n: int) -> str:
     """
-    Print Top-C (series coupling) topology diagram.
+    Build Top-C (series coupling) topology diagram, cached per n.
 
     Shows n tanks with n-1 coupling capacitors in series on main line.
     Each tank is a parallel LC circuit to ground.
@@ -140,20 +214,14 @@ def _print_top_c_diagram(n: int) -> None:
         # Position between tank i and tank i+1
         mid = (tank_pos[i] + tank_pos[i + 1]) // 2
         label = f"Cs{i+1}{i+2}"
-        start = mid - len(label) // 2
-        for j, ch in enumerate(label):
-            if 0 <= start + j < line_len:
-                label_chars[start + j] = ch
+        _overlay(label_chars, mid - len(label) // 2, label)
     label_line = ''.join(label_chars)
 
     def build_line(elements: list[str]) -> str:
         """Build line with elements centered under tank positions."""
         chars = [' '] * line_len
         for pos, elem in zip(tank_pos, elements):
-            start = pos - len(elem) // 2
-            for j, ch in enumerate(elem):
-                if 0 <= start + j < line_len:
-                    chars[start + j] = ch
+            _overlay(chars, pos - len(elem) // 2, elem)
         return ''.join(chars)
 
     # Tank: parallel C and L - all elements same width for alignment
@@ -163,30 +231,27 @@ def _print_top_c_diagram(n: int) -> None:
     #    │     │
     #    └──┬──┘
     tank_w = "┌──┴──┐"  # 7 chars wide, ┴ at center
-    vert_line = build_line(["   │   "] * n)  # │ centered in 7 chars
-    tank_top = build_line([tank_w] * n)
-    tank_r1 = build_line(["│     │"] * n)
+    def uniform_line(elem: str) -> str:
+        """Build line with the same element under every tank position."""
+        return _uniform_row(elem, tank_pos[0], seg_w, n, line_len)
+
+    vert_line = uniform_line("   │   ")  # │ centered in 7 chars
+    tank_top = uniform_line(tank_w)
+    tank_r1 = uniform_line("│     │")
     tank_r2 = build_line([f"Cp{i+1:<2} L{i+1}" for i in range(n)])
-    tank_r3 = build_line(["│     │"] * n)
-    tank_bot = build_line(["└──┬──┘"] * n)
-    gnd_wire = build_line(["   │   "] * n)
-    gnd_sym = build_line(["  GND  "] * n)
-
-    print(label_line)
-    print(main_line)
-    print(vert_line)
-    print(tank_top)
-    print(tank_r1)
-    print(tank_r2)
-    print(tank_r3)
-    print(tank_bot)
-    print(gnd_wire)
-    print(gnd_sym)
-
-
-def _print_shunt_c_diagram(n: int) -> None:
+    tank_r3 = tank_r1
+    tank_bot = uniform_line("└──┬──┘")
+    gnd_wire = vert_line
+    gnd_sym = uniform_line("  GND  ")
+
+    return '\n'.join([label_line, main_line, vert_line, tank_top, tank_r1,
+                      tank_r2, tank_r3, tank_bot, gnd_wire, gnd_sym])
+
+
+@lru_cache(maxsize=32)
+def _shunt_c_diagram(n: int) -> str:
     """
-    Print Shunt-C (bottom-coupled) topology diagram.
+    Build Shunt-C (bottom-coupled) topology diagram, cached per n.
 
     In this topology, coupling capacitors connect the BOTTOMS of adjacent
     tanks horizontally, before they all connect to a common ground.
@@ -204,74 +269,54 @@ def _print_shunt_c_diagram(n: int) -> None:
         """Build line with elements centered under tank positions."""
         chars = [' '] * line_len
         for pos, elem in zip(tank_pos, elements):
-            start = pos - len(elem) // 2
-            for j, ch in enumerate(elem):
-                if 0 <= start + j < line_len:
-                    chars[start + j] = ch
+            _overlay(chars, pos - len(elem) // 2, elem)
         return ''.join(chars)
 
+    def uniform_line(elem: str) -> str:
+        """Build line with the same element under every tank position."""
+        return _uniform_row(elem, tank_pos[0], seg_w, n, line_len)
+
     # Vertical wire from main line to tanks - same width as tank for alignment
-    vert1 = build_line(["   │   "] * n)
-    vert2 = build_line(["   │   "] * n)
+    vert1 = uniform_line("   │   ")
+    vert2 = vert1
 
     # Tank components - same style as Top-C
-    tank_top = build_line(["┌──┴──┐"] * n)
-    tank_r1 = build_line(["│     │"] * n)
+    tank_top = uniform_line("┌──┴──┐")
+    tank_r1 = uniform_line("│     │")
     tank_r2 = build_line([f"Cp{i+1:<2} L{i+1}" for i in range(n)])
-    tank_r3 = build_line(["│     │"] * n)
-    tank_bot = build_line(["└──┬──┘"] * n)
+    tank_r3 = tank_r1
+    tank_bot = uniform_line("└──┬──┘")
 
     # Bottom coupling rail with horizontal coupling caps between tanks
+    junctions = ['┼'] * n
+    junctions[-1] = '┤'
+    junctions[0] = '├'
     coupling_line_chars = [' '] * line_len
-    for i, pos in enumerate(tank_pos):
-        if i == 0:
-            coupling_line_chars[pos] = '├'
-        elif i == n - 1:
-            coupling_line_chars[pos] = '┤'
-        else:
-            coupling_line_chars[pos] = '┼'
-        if i < n - 1:
-            next_pos = tank_pos[i + 1]
-            mid = (pos + next_pos) // 2
-            for j in range(pos + 1, next_pos):
-                coupling_line_chars[j] = '─'
-            label = f"Cs{i+1}{i+2}"
-            start = mid - len(label) // 2
-            for j, ch in enumerate(label):
-                if 0 <= start + j < line_len:
-                    coupling_line_chars[start + j] = ch
+    _overlay(coupling_line_chars, tank_pos[0], ('─' * (seg_w - 1)).join(junctions))
+    for i in range(n_coupling):
+        mid = (tank_pos[i] + tank_pos[i + 1]) // 2
+        label = f"Cs{i+1}{i+2}"
+        _overlay(coupling_line_chars, mid - len(label) // 2, label)
     coupling_line = ''.join(coupling_line_chars)
 
     # Ground connection from center of bottom rail
     center_pos = tank_pos[n // 2]
     gnd_wire_chars = [' '] * line_len
-    gnd_wire_chars[center_pos] = '│'
+    _overlay(gnd_wire_chars, center_pos, '│')
     gnd_wire = ''.join(gnd_wire_chars)
 
     gnd_chars = [' '] * line_len
     gnd_label = "GND"
-    start = center_pos - len(gnd_label) // 2
-    for j, ch in enumerate(gnd_label):
-        if 0 <= start + j < line_len:
-            gnd_chars[start + j] = ch
+    _overlay(gnd_chars, center_pos - len(gnd_label) // 2, gnd_label)
     gnd = ''.join(gnd_chars)
 
-    print(main_line)
-    print(vert1)
-    print(tank_top)
-    print(tank_r1)
-    print(tank_r2)
-    print(tank_r3)
-    print(tank_bot)
-    print(vert2)
-    print(coupling_line)
-    print(gnd_wire)
-    print(gnd)
+    return '\n'.join([main_line, vert1, tank_top, tank_r1, tank_r2, tank_r3,
+                      tank_bot, vert2, coupling_line, gnd_wire, gnd])
 
 
-def _format_eseries_match(value: float, series: str, unit_formatter) -> list[str]:
+def _format_eseries_match(match: ESeriesMatch, unit_formatter) -> list[str]:
     """Format E-series match for a component value."""
-    match = match_component(value, series)
+    value = match.target
     lines = []
     formatted = unit_formatter(match.single_value)
     error_sign = '+' if match.single_value > value else '-' if match.single_value < value else ''
@@ -285,7 +330,7 @@ def _format_eseries_match(value: float, series: str, unit_formatter) -> list[str
     return lines
 
 
-def display_results(result: dict, raw: bool = False,
+def display_results(result: BandpassDesign, raw: bool = False,
                     output_format: str = 'table', quiet: bool = False,
                     eseries: str | None = 'E24',
                     show_plot: bool = False,
@@ -294,7 +339,7 @@ def display_results(result: dict, raw: bool = False,
     Display calculated filter component values.
 
     Args:
-        result: Dict from calculate_bandpass_filter()
+        result: BandpassDesign from calculate_bandpass_filter()
         raw: If True, display values in scientific notation
         output_format: 'table', 'json', or 'csv'
         quiet: If True, output only component values (no header/diagram)
@@ -305,15 +350,15 @@ def display_results(result: dict, raw: bool = False,
     # Handle plot data export first (standalone output)
     if plot_data:
         sweep = frequency_sweep(
-            result['f0'], result['bw'], result['n_resonators'],
-            result['filter_type'],
-            ripple_db=result.get('ripple_db') or 0.5,
+            result.f0, result.bw, result.n_resonators,
+            result.filter_type,
+            ripple_db=result.ripple_db or 0.5,
             points=PLOT_POINTS
         )
         if plot_data == 'json':
-            print(plot_export_json(sweep, result['f0'], result['bw'],
-                                   result['filter_type'], result['n_resonators'],
-                                   result.get('ripple_db')))
+            print(plot_export_json(sweep, result.f0, result.bw,
+                                   result.filter_type, result.n_resonators,
+                                   result.ripple_db))
         else:
             print(plot_export_csv(sweep))
         return
@@ -328,100 +373,109 @@ def display_results(result: dict, raw: bool = False,
         print(format_quiet(result, raw))
         return
 
-    coupling_name = "Top-C (Series)" if result['coupling'] == 'top' else "Shunt-C (Parallel)"
-    title = f"{result['filter_type'].title()} Coupled Resonator Bandpass Filter"
-
-    print(f"\n{title}")
-    print("=" * 50)
-    print(f"Center Frequency f₀: {format_frequency(result['f0'])}")
-    print(f"Lower Cutoff fₗ:     {format_frequency(result['f_low'])}")
-    print(f"Upper Cutoff fₕ:     {format_frequency(result['f_high'])}")
-    print(f"Bandwidth BW:        {format_frequency(result['bw'])}")
-    print(f"Fractional BW:       {result['fbw']*100:.2f}%")
-    print(f"Impedance Z₀:        {result['z0']:.4g} Ω")
-    if result['ripple_db'] is not None:
-        print(f"Ripple:              {result['ripple_db']} dB")
-    print(f"Resonators:          {result['n_resonators']}")
-    print(f"Coupling:            {coupling_name}")
-    print("=" * 50)
+    # Collect the whole report and write it with a single print
+    lines: list[str] = []
+    out = lines.append
+
+    coupling_name = "Top-C (Series)" if result.coupling == 'top' else "Shunt-C (Parallel)"
+    title = f"{result.filter_type.title()} Coupled Resonator Bandpass Filter"
+
+    out(f"\n{title}")
+    out(_RULE)
+    out(f"Center Frequency f₀: {format_frequency(result.f0)}")
+    out(f"Lower Cutoff fₗ:     {format_frequency(result.f_low)}")
+    out(f"Upper Cutoff fₕ:     {format_frequency(result.f_high)}")
+    out(f"Bandwidth BW:        {format_frequency(result.bw)}")
+    out(f"Fractional BW:       {result.fbw*100:.2f}%")
+    out(f"Impedance Z₀:        {result.z0:.4g} Ω")
+    if result.ripple_db is not None:
+        out(f"Ripple:              {result.ripple_db} dB")
+    out(f"Resonators:          {result.n_resonators}")
+    out(f"Coupling:            {coupling_name}")
+    out(_RULE)
 
     # Display warnings if any
-    if result['warnings']:
-        print("\nWarnings:")
-        for w in result['warnings']:
-            print(f"  ⚠ {w}")
+    if result.warnings:
+        out("\nWarnings:")
+        for w in result.warnings:
+            out(f"  ⚠ {w}")
 
     # Q requirement
-    print(f"\nMinimum Component Q: {result['q_min']:.0f}")
-    print(f"  (Q safety factor: {result['q_safety']})")
+    out(f"\nMinimum Component Q: {result.q_min:.0f}")
+    out(f"  (Q safety factor: {result.q_safety})")
 
     # Topology diagram
-    n = result['n_resonators']
-    print("\nTopology:")
-    if result['coupling'] == 'top':
-        _print_top_c_diagram(n)
+    n = result.n_resonators
+    out("\nTopology:")
+    if result.coupling == 'top':
+        out(_top_c_diagram(n))
     else:
-        _print_shunt_c_diagram(n)
+        out(_shunt_c_diagram(n))
 
     # Component values table
-    print(f"\n{'Component Values':^50}")
-    print(f"┌{'─' * 24}┬{'─' * 24}┐")
-    print(f"│{'Tank Capacitors':^24}│{'Inductors':^24}│")
-    print(f"├{'─' * 24}┼{'─' * 24}┤")
+    out(f"\n{'Component Values':^50}")
+    out(_BOX_TOP)
+    out(_BOX_HEADER)
+    out(_BOX_MID)
 
     for i in range(n):
         if raw:
-            cap_str = f"Cp{i+1}: {result['c_tank'][i]:.6e} F"
-            ind_str = f"L{i+1}: {result['L_resonant']:.6e} H"
+            cap_str = f"Cp{i+1}: {result.c_tank[i]:.6e} F"
+            ind_str = f"L{i+1}: {result.L_resonant:.6e} H"
         else:
-            cap_str = f"Cp{i+1}: {format_capacitance(result['c_tank'][i])}"
-            ind_str = f"L{i+1}: {format_inductance(result['L_resonant'])}"
-        print(f"│ {cap_str:<22} │ {ind_str:<22} │")
+            cap_str = f"Cp{i+1}: {format_capacitance(result.c_tank[i])}"
+            ind_str = f"L{i+1}: {format_inductance(result.L_resonant)}"
+        out(f"│ {cap_str:<22} │ {ind_str:<22} │")
 
-    print(f"└{'─' * 24}┴{'─' * 24}┘")
+    out(_BOX_BOT)
 
     # Coupling capacitors
-    print(f"\n┌{'─' * 24}┐")
-    print(f"│{'Coupling Capacitors':^24}│")
-    print(f"├{'─' * 24}┤")
+    out(f"\n{_CC_TOP}")
+    out(_CC_HEADER)
+    out(_CC_MID)
 
-    for i, cs in enumerate(result['c_coupling']):
+    for i, cs in enumerate(result.c_coupling):
         if raw:
             cs_str = f"Cs{i+1}{i+2}: {cs:.6e} F"
         else:
             cs_str = f"Cs{i+1}{i+2}: {format_capacitance(cs)}"
-        print(f"│ {cs_str:<22} │")
+        out(f"│ {cs_str:<22} │")
 
-    print(f"└{'─' * 24}┘")
+    out(_CC_BOT)
 
     # External Q values
-    print(f"\nExternal Q (input):  {result['qe_in']:.2f}")
-    print(f"External Q (output): {result['qe_out']:.2f}")
+    out(f"\nExternal Q (input):  {result.qe_in:.2f}")
+    out(f"External Q (output): {result.qe_out:.2f}")
 
     # E-series matching (capacitors only - inductors should be wound toroids)
     if eseries and not raw:
-        print(f"\n{eseries} Standard Capacitor Recommendations")
-        print(f"{'─' * 45}")
-        print("(Calculated values with nearest standard matches)")
-        print()
-        for i, ct in enumerate(result['c_tank']):
-            print(f"Cp{i+1} Calculated: {format_capacitance(ct)}")
-            for line in _format_eseries_match(ct, eseries, format_capacitance):
-                print(line)
-        for i, cs in enumerate(result['c_coupling']):
-            print(f"Cs{i+1}{i+2} Calculated: {format_capacitance(cs)}")
-            for line in _format_eseries_match(cs, eseries, format_capacitance):
-                print(line)
+        out(f"\n{eseries} Standard Capacitor Recommendations")
+        out(_ESERIES_RULE)
+        out("(Calculated values with nearest standard matches)")
+        out("")
+        c_tank, c_coupling = result.c_tank, result.c_coupling
+        # Match every capacitor in one batch; symmetric designs repeat values.
+        # A parallel pair is shown whenever it beats the single value, so
+        # always run the parallel search here
+        matches = match_components((*c_tank, *c_coupling), eseries,
+                                   parallel_threshold_pct=0)
+        for i, (ct, match) in enumerate(zip(c_tank, matches)):
+            out(f"Cp{i+1} Calculated: {format_capacitance(ct)}")
+            lines.extend(_format_eseries_match(match, format_capacitance))
+        for i, (cs, match) in enumerate(zip(c_coupling, matches[len(c_tank):])):
+            out(f"Cs{i+1}{i+2} Calculated: {format_capacitance(cs)}")
+            lines.extend(_format_eseries_match(match, format_capacitance))
 
     # Frequency response plot
     if show_plot:
         sweep = frequency_sweep(
-            result['f0'], result['bw'], result['n_resonators'],
-            result['filter_type'],
-            ripple_db=result.get('ripple_db') or 0.5,
+            result.f0, result.bw, result.n_resonators,
+            result.filter_type,
+            ripple_db=result.ripple_db or 0.5,
             points=PLOT_POINTS
         )
-        title = f"{result['filter_type'].title()} {result['n_resonators']}-pole Response"
-        print(f"\n{render_ascii_plot(sweep, result['f0'], result['bw'], title=title)}")
+        title = f"{result.filter_type.title()} {result.n_resonators}-pole Response"
+        out(f"\n{render_ascii_plot(sweep, result.f0, result.bw, title=title)}")
 
-    print()
+    out("")
+    print('\n'.join(lines))
@@ -2,23 +2,11 @@
 ASCII frequency response plotting and data export for bandpass filters.
 Renders magnitude response as terminal-friendly ASCII art.
 """
-import json
+import io
 import math
+from functools import lru_cache
+from itertools import chain, starmap
 
-def _freq_to_col(f: float, f_min: float, f_max: float, width: int) -> int:
-    """Map log(frequency) to column index (0 to width-1)."""
-    if f_min == f_max:
-        return width // 2  # Single point: center it
-    log_min, log_max = math.log10(f_min), math.log10(f_max)
-    log_f = math.log10(f)
-    col = int((log_f - log_min) / (log_max - log_min) * (width - 1))
-    return max(0, min(width - 1, col))
-
-def _db_to_row(db: float, db_min: float, height: int) -> int:
-    """Map dB to row index (0=top=0dB, height-1=bottom=db_min)."""
-    db_clamped = max(db_min, min(0, db))
-    row = int(-db_clamped / (-db_min) * (height - 1))
-    return max(0, min(height - 1, row))
 
 def render_ascii_plot(
     sweep_data: list[tuple[float, float]],
@@ -50,31 +38,47 @@ def render_ascii_plot(
     f_min = sweep_data[0][0]
     f_max = sweep_data[-1][0]
 
-    # Build 2D character grid
-    grid = [[' ' for _ in range(width)] for _ in range(height)]
-
-    # Plot sweep data - fill from 0dB down to the curve
-    for f, db in sweep_data:
-        col = _freq_to_col(f, f_min, f_max, width)
-        row = _db_to_row(db, db_min, height)
-        # Fill from top (0dB) down to this row
-        for r in range(row + 1):
-            grid[r][col] = '#'
-
-    # Draw -3dB reference line
-    row_3db = _db_to_row(-3.0, db_min, height)
-    for col in range(width):
-        if grid[row_3db][col] == ' ':
-            grid[row_3db][col] = '-'
-
-    # Mark center frequency with vertical line
-    col_f0 = _freq_to_col(f0, f_min, f_max, width)
-    for row in range(height):
-        if grid[row][col_f0] in (' ', '-'):
-            grid[row][col_f0] = '|'
-        elif grid[row][col_f0] == '#':
-            pass  # Keep the fill
-    grid[row_3db][col_f0] = '+'  # Intersection marker
+    # Flat character grid, row-major, one byte per cell (all glyphs are ASCII)
+    grid = bytearray(b' ' * (width * height))
+
+    # Map all samples to grid coordinates with the per-sweep constants hoisted
+    # and the arithmetic inline. The f0 and -3dB markers ride along as one
+    # extra trailing point each, so the curve and the markers share a single
+    # mapping expression
+    last_col, last_row = width - 1, height - 1
+    if f_min == f_max:
+        cols = [width // 2] * (len(sweep_data) + 1)  # Single point: center it
+    else:
+        log10 = math.log10
+        log_min = log10(f_min)
+        log_range = log10(f_max) - log_min
+        cols = [max(0, min(last_col, int((log10(f) - log_min) / log_range * last_col)))
+                for f, _ in chain(sweep_data, ((f0, None),))]
+    db_range = -db_min
+    rows = [max(0, min(last_row, int(-max(db_min, min(0, db)) / db_range * last_row)))
+            for _, db in chain(sweep_data, ((None, -3.0),))]
+    col_f0 = cols.pop()
+    row_3db = rows.pop()
+
+    # Plot sweep data - fill from 0dB down to the curve. Samples sharing a
+    # column are reduced to the deepest row first (rows grow downwards), so
+    # each column is filled once
+    fill_to = [-1] * width
+    for col, row in zip(cols, rows):
+        if row > fill_to[col]:
+            fill_to[col] = row
+    for col, row in enumerate(fill_to):
+        if row >= 0:
+            # Fill from top (0dB) down to this row: a strided column slice
+            grid[col:row * width + col + 1:width] = b'#' * (row + 1)
+
+    # Draw -3dB reference line over the blank cells of its row
+    start = row_3db * width
+    grid[start:start + width] = grid[start:start + width].replace(b' ', b'-')
+
+    # Mark center frequency with vertical line, keeping the fill
+    grid[col_f0::width] = grid[col_f0::width].replace(b' ', b'|').replace(b'-', b'|')
+    grid[start + col_f0] = ord('+')  # Intersection marker
 
     # Build output string
     lines = [title]
@@ -89,7 +93,7 @@ def render_ascii_plot(
             prefix = f"{db_label:4d} |"
         else:
             prefix = "     |"
-        lines.append(prefix + ''.join(grid[row]))
+        lines.append(prefix + grid[row * width:(row + 1) * width].decode('ascii'))
 
     # X-axis
     lines.append("     +" + "-" * width)
@@ -105,6 +109,12 @@ def render_ascii_plot(
 
 def _format_freq(f: float) -> str:
     """Format frequency with appropriate unit."""
+    # 0.0 and -0.0 share a cache key but format differently; skip the cache
+    return _format_freq_cached(f) if f else _format_freq_uncached(f)
+
+
+def _format_freq_uncached(f: float) -> str:
+    """Unit formatting behind _format_freq."""
     if f >= 1e9:
         return f"{f/1e9:.2f}G"
     elif f >= 1e6:
@@ -113,29 +123,68 @@ def _format_freq(f: float) -> str:
         return f"{f/1e3:.2f}k"
     return f"{f:.1f}"
 
+
+_format_freq_cached = lru_cache(maxsize=256)(_format_freq_uncached)
+
+# One sample object of the indent=2 "data" array. json.dumps(indent=2) runs
+# the pure-Python encoder, so the fixed-layout rows are formatted from this
+# template instead; float repr is what json emits for finite floats
+_JSON_SAMPLE = '\n    {{\n      "frequency_hz": {!r},\n      "magnitude_db": {!r}\n    }}'.format
+
+
 def export_json(
     sweep_data: list[tuple[float, float]],
     f0: float,
     bw: float,
     filter_type: str,
     order: int,
-    ripple_db: float | None = None
+    ripple_db: float | None = None,
+    columnar: bool = False
 ) -> str:
-    """Export sweep data as JSON string."""
+    """
+    Export sweep data as JSON string.
+
+    By default each sample is a {"frequency_hz", "magnitude_db"} object.
+    With columnar=True the samples are emitted once as
+    {"columns": [...], "rows": [[f, db], ...]}, avoiding a dict per row
+    for large sweeps.
+    """
+    import json  # deferred: only JSON export needs it
     data = {
         "filter_type": filter_type,
         "f0_hz": f0,
         "bandwidth_hz": bw,
         "order": order,
-        "data": [{"frequency_hz": f, "magnitude_db": round(db, 2)} for f, db in sweep_data]
+        "data": []
     }
     if ripple_db is not None:
         data["ripple_db"] = ripple_db
+
+    if not columnar and sweep_data:
+        rows = ','.join([_JSON_SAMPLE(f, round(db, 2)) for f, db in sweep_data])
+        # repr spells non-finite floats inf/nan where JSON wants Infinity/NaN;
+        # neither substring can come from the keys or finite numbers
+        if 'inf' not in rows and 'nan' not in rows:
+            # Encode the small header with json and splice the rows into its
+            # empty "data" array; a raw newline never occurs inside a JSON
+            # string, so the split point is unique
+            head, tail = json.dumps(data, indent=2).split('\n  "data": []', 1)
+            return f'{head}\n  "data": [{rows}\n  ]{tail}'
+
+    if columnar:
+        data["data"] = {
+            "columns": ["frequency_hz", "magnitude_db"],
+            "rows": [[f, round(db, 2)] for f, db in sweep_data]
+        }
+    else:
+        data["data"] = [{"frequency_hz": f, "magnitude_db": round(db, 2)} for f, db in sweep_data]
     return json.dumps(data, indent=2)
 
 def export_csv(sweep_data: list[tuple[float, float]]) -> str:
     """Export sweep data as CSV string."""
-    lines = ["frequency_hz,magnitude_db"]
-    for f, db in sweep_data:
-        lines.append(f"{f},{db:.2f}")
-    return '\n'.join(lines)
+    out = io.StringIO()
+    out.write("frequency_hz,magnitude_db")
+    # Bound template driven by starmap: the per-row loop stays in C and no
+    # list of row strings is materialized
+    out.writelines(starmap("\n{},{:.2f}".format, sweep_data))
+    return out.getvalue()